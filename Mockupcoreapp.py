@@ -1,8 +1,20 @@
 import sys
 import os
 import struct
+import mmap
+import re
+import hashlib
+import json
+import shutil
+import tempfile
+import urllib.request
+import urllib.error
+import functools
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import List, Set, Optional
+from typing import List, Set, Optional, Tuple
 import win32com.client
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
@@ -10,8 +22,8 @@ from PyQt5.QtWidgets import (
     QTextEdit, QProgressBar, QFileDialog, QGroupBox, QSizePolicy,
     QScrollArea, QFrame, QDesktopWidget
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QRect, QPoint, QSize
-from PyQt5.QtGui import QPixmap, QFont, QFontDatabase, QPainter, QPen, QColor, QImage
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QElapsedTimer, QRect, QPoint, QSize, QEvent
+from PyQt5.QtGui import QPixmap, QPixmapCache, QFont, QFontDatabase, QFontMetrics, QPainter, QPen, QColor, QImage, QImageReader, QTextCursor, QIcon
 
 # --- RESOURCE PATH HELPER FOR PYINSTALLER ---
 def resource_path(relative_path):
@@ -23,18 +35,31 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 # --- HELPER FUNCTION FOR UNIQUE FILENAMES ---
-def get_unique_filepath(filepath: str) -> str:
+def get_unique_filepath(filepath: str, existing: Optional[Set[str]] = None) -> str:
     """
     Generate a unique filepath by adding a number suffix if file already exists.
     Example: if 'mockup.jpg' exists, returns 'mockup_1.jpg', then 'mockup_2.jpg', etc.
-    """
-    if not os.path.exists(filepath):
-        return filepath
     
+    If `existing` is given (normcased basenames already in the directory, see
+    list_existing_filenames), candidates are checked against it instead of the
+    filesystem and the chosen name is added to it.
+    """
     directory = os.path.dirname(filepath)
     filename = os.path.basename(filepath)
     name, ext = os.path.splitext(filename)
     
+    if existing is not None:
+        candidate = filename
+        counter = 1
+        while os.path.normcase(candidate) in existing:
+            candidate = f"{name}_{counter}{ext}"
+            counter += 1
+        existing.add(os.path.normcase(candidate))
+        return os.path.join(directory, candidate)
+    
+    if not os.path.exists(filepath):
+        return filepath
+    
     counter = 1
     while True:
         new_filename = f"{name}_{counter}{ext}"
@@ -43,78 +68,123 @@ def get_unique_filepath(filepath: str) -> str:
             return new_filepath
         counter += 1
 
+def list_existing_filenames(directory: str) -> Set[str]:
+    """Return the normcased names in a directory with a single listing, for get_unique_filepath"""
+    try:
+        with os.scandir(directory) as entries:
+            return {os.path.normcase(entry.name) for entry in entries}
+    except OSError:
+        return set()
+
 # --- PSD THUMBNAIL EXTRACTOR ---
-def extract_psd_thumbnail(psd_path: str) -> Optional[QPixmap]:
+# Precompiled big-endian readers for the PSD header and Image Resources walk.
+# Struct.unpack_from(...)[0] measured faster on CPython than int.from_bytes over a slice.
+# signature, version, reserved, channels, height, width, depth, color mode, color mode data length
+_HDR = struct.Struct('>4sH6sHIIHHI')
+_RESOURCE = struct.Struct('>4sHB')  # '8BIM', resource id, Pascal name length
+_U32 = struct.Struct('>I')
+_PSD_HEAD_READ = 65536  # The thumbnail sits in the first tens of KiB of a PSD
+
+def _find_psd_thumbnail(buf) -> Optional[Tuple[int, int]]:
+    """
+    Walk the PSD header and Image Resources in buf (bytes or mmap).
+    Returns (offset, length) of the embedded JPEG thumbnail, or None.
     """
-    Extract embedded thumbnail from PSD file.
+    unpack_u32 = _U32.unpack_from
+    unpack_resource = _RESOURCE.unpack_from
+    
+    # Header and Color Mode Data length in one unpack
+    signature, version, _, channels, height, width, depth, color_mode, color_mode_length = _HDR.unpack_from(buf, 0)
+    if signature != b'8BPS':
+        return None
+    
+    # Skip Color Mode Data section
+    off = _HDR.size + color_mode_length
+    
+    # Read Image Resources section (contains thumbnail)
+    resources_length = unpack_u32(buf, off)[0]
+    off += 4
+    resources_end = off + resources_length
+    
+    # Search for thumbnail resource (ID 1033 or 1036)
+    while off < resources_end:
+        # Signature, ID and name length in one unpack
+        resource_signature, resource_id, name_length = unpack_resource(buf, off)
+        if resource_signature != b'8BIM':
+            break
+        
+        # Skip Pascal string (length byte + name), padded to make even
+        off += 6 + ((name_length + 2) & ~1)
+        
+        # Resource data size
+        data_size = unpack_u32(buf, off)[0]
+        off += 4
+        
+        # Check if this is a thumbnail resource
+        if resource_id == 1036:  # JPEG thumbnail
+            # Skip thumbnail header to reach JFIF data
+            return off + 28, data_size - 28
+        
+        # Advance past data, padding to make even
+        off += (data_size + 1) & ~1
+    
+    return None
+
+def extract_psd_thumbnail_bytes(psd_path: str) -> Optional[bytes]:
+    """
+    Extract embedded JPEG thumbnail bytes from PSD file.
     PSDs contain a thumbnail in the Image Resources section.
+    Pure file parsing (no Qt), so it is safe to call from worker threads.
     """
     try:
-        with open(psd_path, 'rb') as f:
-            # Read PSD header
-            signature = f.read(4)
-            if signature != b'8BPS':
+        # Raw fd + one read: no buffered-IO layer, a single syscall in the common case
+        fd = os.open(psd_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            head = os.read(fd, _PSD_HEAD_READ)
+            if len(head) < _HDR.size:
                 return None
             
-            version = struct.unpack('>H', f.read(2))[0]
-            f.read(6)  # Reserved
-            channels = struct.unpack('>H', f.read(2))[0]
-            height = struct.unpack('>I', f.read(4))[0]
-            width = struct.unpack('>I', f.read(4))[0]
-            depth = struct.unpack('>H', f.read(2))[0]
-            color_mode = struct.unpack('>H', f.read(2))[0]
+            try:
+                region = _find_psd_thumbnail(head)
+            except struct.error:
+                # Whole file was read, so it's genuinely truncated
+                if len(head) < _PSD_HEAD_READ:
+                    raise
+                # Resource headers run past the first read - map the file and walk
+                # it there, so only the pages actually touched are paged in
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    region = _find_psd_thumbnail(mm)
             
-            # Skip Color Mode Data section
-            color_mode_length = struct.unpack('>I', f.read(4))[0]
-            f.read(color_mode_length)
+            if not region:
+                return None
+            start, length = region
+            if start + length <= len(head):
+                return head[start:start + length]
             
-            # Read Image Resources section (contains thumbnail)
-            resources_length = struct.unpack('>I', f.read(4))[0]
-            resources_end = f.tell() + resources_length
-            
-            # Search for thumbnail resource (ID 1033 or 1036)
-            while f.tell() < resources_end:
-                resource_signature = f.read(4)
-                if resource_signature != b'8BIM':
-                    break
-                
-                resource_id = struct.unpack('>H', f.read(2))[0]
-                
-                # Read Pascal string (resource name)
-                name_length = struct.unpack('B', f.read(1))[0]
-                if name_length > 0:
-                    f.read(name_length)
-                # Padding to make even
-                if (name_length + 1) % 2 != 0:
-                    f.read(1)
-                
-                # Resource data size
-                data_size = struct.unpack('>I', f.read(4))[0]
-                
-                # Check if this is a thumbnail resource
-                if resource_id in [1033, 1036]:  # JPEG or RAW thumbnail
-                    # Skip to JFIF data (skip format info)
-                    if resource_id == 1036:  # JPEG thumbnail
-                        f.read(28)  # Skip thumbnail header
-                        jpeg_data = f.read(data_size - 28)
-                        
-                        # Load JPEG into QPixmap
-                        image = QImage()
-                        if image.loadFromData(jpeg_data):
-                            return QPixmap.fromImage(image)
-                else:
-                    # Skip this resource
-                    f.read(data_size)
-                
-                # Padding to make even
-                if data_size % 2 != 0:
-                    f.read(1)
+            # Thumbnail extends past the first read - fetch just that block
+            os.lseek(fd, start, os.SEEK_SET)
+            return os.read(fd, length)
+        finally:
+            os.close(fd)
             
     except Exception as e:
         print(f"Error extracting thumbnail from {psd_path}: {e}")
     
     return None
 
+def image_from_jpeg(jpeg_data: Optional[bytes]) -> Optional[QImage]:
+    """Decode JPEG thumbnail bytes into a QImage"""
+    if not jpeg_data:
+        return None
+    image = QImage()
+    if image.loadFromData(jpeg_data):
+        return image
+    return None
+
+def extract_psd_thumbnail(psd_path: str) -> Optional[QImage]:
+    """Extract embedded thumbnail from PSD file as a QImage"""
+    return image_from_jpeg(extract_psd_thumbnail_bytes(psd_path))
+
 # --- STYLING ---
 APP_QSS = """
 QMainWindow, QWidget {
@@ -298,39 +368,6 @@ QFrame#SelectedArtworkBox {
 }
 """
 
-class SmoothMarquee(QLabel):
-    def __init__(self, text, parent=None):
-        super().__init__(parent)
-        self.setObjectName("MarqueeBanner")
-        self.setFixedHeight(100)
-        self.text_content = text
-        self.offset = 0
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.scroll_text)
-        self.timer.start(16)
-
-    def scroll_text(self):
-        self.offset -= 2 
-        self.update()
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.TextAntialiasing)
-        font = self.font()
-        font.setPointSize(32)
-        font.setWeight(QFont.Bold)
-        font.setLetterSpacing(QFont.AbsoluteSpacing, 5)
-        painter.setFont(font)
-        metrics = painter.fontMetrics()
-        text_width = metrics.horizontalAdvance(self.text_content)
-        cap_height = metrics.capHeight()
-        y_pos = int((self.height() + cap_height) / 2)
-        if abs(self.offset) >= text_width:
-            self.offset = 0
-        painter.drawText(QPoint(self.offset, y_pos), self.text_content)
-        painter.drawText(QPoint(self.offset + text_width, y_pos), self.text_content)
-
-
 class LoadingSplash(QWidget):
     """Loading splash screen with progress indicator"""
     
@@ -472,16 +509,14 @@ class LoadingSplash(QWidget):
                 padding: 0px;
             }
         """)
-        QApplication.processEvents()  # Force UI update
         
-        # Small delay to show the feedback
+        # Small delay to show the feedback (the restyle repaints meanwhile)
         QTimer.singleShot(150, self.close)  # 150ms delay before closing
     
     def update_status(self, message, detail=""):
         """Update the loading message"""
         self.status_label.setText(message)
         # Detail is ignored - label is hidden
-        QApplication.processEvents()  # Force UI update
     
     def set_progress_range(self, min_val, max_val):
         """Set progress bar range"""
@@ -490,40 +525,92 @@ class LoadingSplash(QWidget):
     def set_progress_value(self, value):
         """Update progress bar value"""
         self.progress.setValue(value)
-        QApplication.processEvents()  # Force UI update
 
 
 class SmoothMarquee(QLabel):
+    FRAME_INTERVAL_MS = round(1000 / 60)  # 17ms - one tick per 60Hz display frame
+    SCROLL_SPEED = 2 / 16  # Pixels per millisecond (125px/s, ~2.1px per tick)
+    
     def __init__(self, text, parent=None):
         super().__init__(parent)
         self.setObjectName("MarqueeBanner")
         self.setFixedHeight(100)
         self.text_content = text
         self.offset = 0
+        self._accum = 0.0  # Sub-pixel scroll position; offset is its whole-pixel part
+        self._cached = None  # Pre-rendered text, rebuilt lazily by paintEvent
+        self._update_font()
+        # Scroll by real elapsed time, so late or bunched-up ticks don't change the speed
+        self._clock = QElapsedTimer()
+        self._clock.start()
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.scroll_text)
-        self.timer.start(16)
+        self.timer.start(self.FRAME_INTERVAL_MS)
+
+    def _update_font(self):
+        """Build the banner font and its metrics once (and again if the widget font changes)"""
+        font = QFont(self.font())
+        font.setPointSize(32)
+        font.setWeight(QFont.Bold)
+        font.setLetterSpacing(QFont.AbsoluteSpacing, 5)
+        metrics = QFontMetrics(font)
+        self._font = font
+        self._text_width = metrics.horizontalAdvance(self.text_content)
+        self._cap_height = metrics.capHeight()
+        self._update_y_pos()
+
+    def _update_y_pos(self):
+        self._y_pos = int((self.height() + self._cap_height) / 2)
+
+    def _rebuild_cache(self):
+        """Render the banner text once into a pixmap that paintEvent just blits"""
+        # Render at device resolution so the text stays crisp on HiDPI screens
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(max(1, int(self._text_width * ratio)), max(1, int(self.height() * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        painter.setFont(self._font)
+        painter.setPen(self.palette().color(self.foregroundRole()))
+        painter.drawText(QPoint(0, self._y_pos), self.text_content)
+        painter.end()
+        self._cached = pixmap
+
+    def resizeEvent(self, event):
+        self._update_y_pos()
+        self._cached = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event):
+        # Font, palette or stylesheet changes alter the rendered text
+        if event.type() in (QEvent.FontChange, QEvent.StyleChange):
+            self._update_font()
+            self._cached = None
+        elif event.type() == QEvent.PaletteChange:
+            self._cached = None
+        super().changeEvent(event)
 
     def scroll_text(self):
-        self.offset -= 2 
-        self.update()
+        self._accum -= self.SCROLL_SPEED * self._clock.restart()
+        if self._text_width and -self._accum >= self._text_width:
+            # Modulo, not one subtraction - a stalled event loop can skip several widths
+            self._accum = -(-self._accum % self._text_width)
+        
+        # Text is drawn at integer positions - only repaint when that moves
+        # (ticks that arrive bunched together, under 8ms apart, move less than a pixel)
+        new_offset = int(self._accum)
+        if new_offset != self.offset:
+            self.offset = new_offset
+            self.update()
 
     def paintEvent(self, event):
+        if self._cached is None:
+            self._rebuild_cache()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.TextAntialiasing)
-        font = self.font()
-        font.setPointSize(32)
-        font.setWeight(QFont.Bold)
-        font.setLetterSpacing(QFont.AbsoluteSpacing, 5)
-        painter.setFont(font)
-        metrics = painter.fontMetrics()
-        text_width = metrics.horizontalAdvance(self.text_content)
-        cap_height = metrics.capHeight()
-        y_pos = int((self.height() + cap_height) / 2)
-        if abs(self.offset) >= text_width:
-            self.offset = 0
-        painter.drawText(QPoint(self.offset, y_pos), self.text_content)
-        painter.drawText(QPoint(self.offset + text_width, y_pos), self.text_content)
+        painter.drawPixmap(QPoint(self.offset, 0), self._cached)
+        painter.drawPixmap(QPoint(self.offset + self._text_width, 0), self._cached)
 
 
 class MockupThumbnail(QLabel):
@@ -531,188 +618,457 @@ class MockupThumbnail(QLabel):
     
     clicked = pyqtSignal(str)  # Emits PSD path when clicked
     
-    def __init__(self, psd_path, parent=None):
+    THUMBNAIL_WIDTH = 160
+    THUMBNAIL_HEIGHT = 200  # 4:5 ratio
+    
+    def __init__(self, psd_path, library=None, parent=None, defer_load=False):
         super().__init__(parent)
         self.psd_path = psd_path
+        self.library = library  # MockupLibrary used for the thumbnail disk cache
         self.is_selected = False
-        self.thumbnail_width = 160
-        self.thumbnail_height = 200  # 4:5 ratio
+        self.is_loaded = False  # True once the real (or final fallback) thumbnail is shown
+        self.thumbnail_width = self.THUMBNAIL_WIDTH
+        self.thumbnail_height = self.THUMBNAIL_HEIGHT
         
         self.setFixedSize(self.thumbnail_width, self.thumbnail_height)
         self.setCursor(Qt.PointingHandCursor)
         self.setStyleSheet("background: white; border: 2px solid #1a1a1a;")
         
-        # Load actual PSD thumbnail
-        self.load_thumbnail()
+        # Reuse a thumbnail another widget already built for this PSD. Otherwise load
+        # it now, or show the placeholder until set_preview_image() delivers it
+        # from the background loader
+        if self.load_cached():
+            pass
+        elif defer_load:
+            self._set_base_pixmap(self._build_base_pixmap(None))
+        else:
+            self.load_thumbnail()
+    
+    def _pixmap_cache_key(self):
+        """QPixmapCache key for this PSD's finished thumbnail (None if it can't be stat'd)"""
+        try:
+            return f"thumb:{self.psd_path}:{os.stat(self.psd_path).st_mtime_ns}"
+        except OSError:
+            return None
+    
+    def load_cached(self):
+        """Show the thumbnail from QPixmapCache if present. Returns True on a hit"""
+        key = self._pixmap_cache_key()
+        pixmap = QPixmapCache.find(key) if key else None
+        if pixmap is None or pixmap.isNull():
+            return False
+        self._set_base_pixmap(pixmap)
+        self.is_loaded = True
+        return True
         
     def load_thumbnail(self):
-        """Load actual PSD thumbnail - FILLS the square (crops to fit)"""
-        # Try to extract real PSD thumbnail
-        psd_thumb = extract_psd_thumbnail(self.psd_path)
+        """Load actual PSD thumbnail synchronously"""
+        # Try to extract real PSD thumbnail (cached on disk by the library)
+        if self.library:
+            psd_thumb = self.library.get_thumbnail(self.psd_path)
+        else:
+            psd_thumb = extract_psd_thumbnail(self.psd_path)
+        self.set_thumbnail(psd_thumb)
+    
+    @classmethod
+    def compose_preview(cls, psd_thumb):
+        """
+        Scale and center-crop a PSD thumbnail so it FILLS the tile.
+        Returns None when there is no thumbnail. Works on a QImage and touches
+        no widgets, so it can run on the thumbnail worker pool.
+        """
+        if psd_thumb is None or psd_thumb.isNull():
+            return None
         
         # Create background
-        pixmap = QPixmap(self.thumbnail_width, self.thumbnail_height)
-        pixmap.fill(QColor("#ffffff"))  # White background
-        
-        if psd_thumb and not psd_thumb.isNull():
-            # FILL THE SQUARE - Scale to fill, then crop
-            scaled = psd_thumb.scaled(
-                self.thumbnail_width, 
-                self.thumbnail_height, 
-                Qt.KeepAspectRatioByExpanding,  # Fill entire space, crop if needed
-                Qt.SmoothTransformation
-            )
-            
-            # Center-crop the image
-            painter = QPainter(pixmap)
-            x = (self.thumbnail_width - scaled.width()) // 2
-            y = (self.thumbnail_height - scaled.height()) // 2
-            painter.drawPixmap(x, y, scaled)
-            painter.end()
-            
-        else:
-            # Fallback placeholder - show filename
-            painter = QPainter(pixmap)
-            painter.setPen(QColor("#1a1a1a"))
-            
-            # Draw PSD icon placeholder
-            font = QFont("Space Grotesk", 36, QFont.Bold)
-            painter.setFont(font)
-            painter.drawText(QRect(0, 0, self.thumbnail_width, self.thumbnail_height - 40), 
-                           Qt.AlignCenter, "PSD")
-            
-            # Draw filename below
-            filename = os.path.basename(self.psd_path)
-            # Truncate long filenames
-            if len(filename) > 18:
-                filename = filename[:15] + "..."
-            
-            font.setPointSize(9)
-            font.setWeight(QFont.Normal)
-            painter.setFont(font)
-            painter.drawText(QRect(5, self.thumbnail_height - 35, self.thumbnail_width - 10, 30), 
-                           Qt.AlignCenter | Qt.TextWordWrap, filename)
-            painter.end()
+        image = QImage(cls.THUMBNAIL_WIDTH, cls.THUMBNAIL_HEIGHT, QImage.Format_ARGB32_Premultiplied)
+        image.fill(QColor("#ffffff"))  # White background
+        
+        # FILL THE SQUARE - Scale to fill, then crop
+        scaled = psd_thumb.scaled(
+            cls.THUMBNAIL_WIDTH, 
+            cls.THUMBNAIL_HEIGHT, 
+            Qt.KeepAspectRatioByExpanding,  # Fill entire space, crop if needed
+            Qt.SmoothTransformation
+        )
+        
+        # Center-crop the image
+        painter = QPainter(image)
+        x = (cls.THUMBNAIL_WIDTH - scaled.width()) // 2
+        y = (cls.THUMBNAIL_HEIGHT - scaled.height()) // 2
+        painter.drawImage(x, y, scaled)
+        painter.end()
+        return image
+    
+    @classmethod
+    def preview_from_jpeg(cls, jpeg_data):
+        """Decode JPEG thumbnail bytes and compose the tile image (worker-pool safe)"""
+        return cls.compose_preview(image_from_jpeg(jpeg_data))
+    
+    def set_thumbnail(self, psd_thumb):
+        """Display PSD thumbnail"""
+        self.set_preview_image(self.compose_preview(psd_thumb))
+    
+    def set_preview_image(self, preview):
+        """
+        Display a tile image from compose_preview (None shows the placeholder)
+        and share it with other widgets via QPixmapCache.
+        """
+        if preview is None:
+            self._set_base_pixmap(self._build_base_pixmap(None))
+            self.is_loaded = True
+            return
+        
+        # The only GUI-thread work left for a real preview is the upload to a pixmap
+        pixmap = QPixmap.fromImage(preview)
+        self._set_base_pixmap(pixmap)
+        self.is_loaded = True
+        
+        # Only real previews are shared - placeholders are cheap to redraw
+        key = self._pixmap_cache_key()
+        if key:
+            QPixmapCache.insert(key, pixmap)
+    
+    def _build_base_pixmap(self, psd_thumb):
+        """
+        Build the display pixmap - FILLS the square (crops to fit).
+        Scaling and compositing happen on a CPU-side QImage, converted to a
+        QPixmap exactly once at the end.
+        """
+        preview = self.compose_preview(psd_thumb)
+        if preview is not None:
+            return QPixmap.fromImage(preview)
+        
+        # Fallback placeholder - show filename
+        # Create background
+        image = QImage(self.thumbnail_width, self.thumbnail_height, QImage.Format_ARGB32_Premultiplied)
+        image.fill(QColor("#ffffff"))  # White background
+        
+        painter = QPainter(image)
+        painter.setPen(QColor("#1a1a1a"))
         
+        # Draw PSD icon placeholder
+        font = QFont("Space Grotesk", 36, QFont.Bold)
+        painter.setFont(font)
+        painter.drawText(QRect(0, 0, self.thumbnail_width, self.thumbnail_height - 40), 
+                       Qt.AlignCenter, "PSD")
+        
+        # Draw filename below
+        filename = os.path.basename(self.psd_path)
+        # Truncate long filenames
+        if len(filename) > 18:
+            filename = filename[:15] + "..."
+        
+        font.setPointSize(9)
+        font.setWeight(QFont.Normal)
+        painter.setFont(font)
+        painter.drawText(QRect(5, self.thumbnail_height - 35, self.thumbnail_width - 10, 30), 
+                       Qt.AlignCenter | Qt.TextWordWrap, filename)
+        painter.end()
+        
+        return QPixmap.fromImage(image)
+    
+    def _set_base_pixmap(self, pixmap):
         self.base_pixmap = pixmap
-        self.update_display()
+        self.setPixmap(pixmap)
     
-    def update_display(self):
-        """Update display with selection state"""
-        display_pixmap = self.base_pixmap.copy()
+    def paintEvent(self, event):
+        """Draw the thumbnail, then the selection overlay on top when selected"""
+        super().paintEvent(event)
+        if not self.is_selected:
+            return
         
-        if self.is_selected:
-            # Draw selection overlay
-            painter = QPainter(display_pixmap)
-            
-            # Semi-transparent overlay
-            painter.fillRect(0, 0, self.thumbnail_width, self.thumbnail_height, 
-                           QColor(87, 95, 214, 140))
-            
-            # Checkmark
-            painter.setPen(QPen(QColor("white"), 8))
-            painter.setRenderHint(QPainter.Antialiasing)
-            
-            center_x = self.thumbnail_width // 2
-            center_y = self.thumbnail_height // 2
-            
-            # Draw checkmark
-            painter.drawLine(center_x - 20, center_y, center_x - 5, center_y + 15)
-            painter.drawLine(center_x - 5, center_y + 15, center_x + 25, center_y - 20)
-            
-            painter.end()
+        # Overlay covers the pixmap area (inside the border)
+        area = self.contentsRect()
+        painter = QPainter(self)
+        
+        # Semi-transparent overlay
+        painter.fillRect(area, QColor(87, 95, 214, 140))
+        
+        # Checkmark
+        painter.setPen(QPen(QColor("white"), 8))
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        center_x = area.left() + self.thumbnail_width // 2
+        center_y = area.top() + self.thumbnail_height // 2
+        
+        # Draw checkmark
+        painter.drawLine(center_x - 20, center_y, center_x - 5, center_y + 15)
+        painter.drawLine(center_x - 5, center_y + 15, center_x + 25, center_y - 20)
         
-        self.setPixmap(display_pixmap)
+        painter.end()
     
     def mousePressEvent(self, event):
         """Toggle selection on click"""
         self.is_selected = not self.is_selected
-        self.update_display()
+        self.update()
         self.clicked.emit(self.psd_path)
     
     def set_selected(self, selected):
         """Programmatically set selection state"""
+        # Select/deselect all touch every tile - only repaint the ones that change
+        if self.is_selected == selected:
+            return
         self.is_selected = selected
-        self.update_display()
+        self.update()
 
 
 def _jsx(path):
     return path.replace("\\", "/")
 
-def build_jsx(psd, art, out):
-    return f"""
+@functools.lru_cache(maxsize=1024)
+def _js_str(path):
+    """Quote a path as a JavaScript string literal (memoized - the artwork path repeats per job)"""
+    return json.dumps(_jsx(path))
+
+# Per-mockup logic shared by single and batch renders.
+# processJob returns "OK" or the error message so batches can report per file.
+_JSX_PROCESS_JOB = """
+function findLayer(container) {
+    for (var i = 0; i < container.layers.length; i++) {
+        var l = container.layers[i];
+        if (l.typename === "ArtLayer") {
+            var n = l.name.toUpperCase();
+            if (n.indexOf("DESIGN") !== -1 || n.indexOf("ARTWORK") !== -1 || n.indexOf("PLACE") !== -1) return l;
+        } else if (l.typename === "LayerSet") {
+            var f = findLayer(l);
+            if (f) return f;
+        }
+    }
+    return null;
+}
+
+function processJob(psdPath, artPath, outPath) {
+    try {
+        var mainDoc = app.open(new File(psdPath));
+        var artFile = new File(artPath);
+        var outFile = new File(outPath);
+
+        var target = findLayer(mainDoc);
+        if(target && target.kind == LayerKind.SMARTOBJECT) {
+            mainDoc.activeLayer = target;
+            var idplacedLayerEditContents = stringIDToTypeID("placedLayerEditContents");
+            executeAction(idplacedLayerEditContents, new ActionDescriptor(), DialogModes.NO);
+            var smartDoc = app.activeDocument;
+            smartDoc.activeLayer.isBackgroundLayer ? null : smartDoc.artLayers.add(); 
+            var idPlc = charIDToTypeID("Plc ");
+            var desc = new ActionDescriptor();
+            desc.putPath(charIDToTypeID("null"), artFile);
+            desc.putEnumerated(charIDToTypeID("FTcs"), charIDToTypeID("QCSt"), charIDToTypeID("Qcsa"));
+            executeAction(idPlc, desc, DialogModes.NO);
+            var artLayer = smartDoc.activeLayer;
+            var artW = artLayer.bounds[2].value - artLayer.bounds[0].value;
+            var artH = artLayer.bounds[3].value - artLayer.bounds[1].value;
+            var canvasW = smartDoc.width.value;
+            var canvasH = smartDoc.height.value;
+            var scaleX = (canvasW / artW) * 100;
+            var scaleY = (canvasH / artH) * 100;
+            var scale = Math.max(scaleX, scaleY); 
+            artLayer.resize(scale, scale, AnchorPosition.MIDDLECENTER);
+            var currentBounds = artLayer.bounds;
+            var currentW = currentBounds[2].value - currentBounds[0].value;
+            var currentH = currentBounds[3].value - currentBounds[1].value;
+            artLayer.translate(canvasW/2 - (currentBounds[0].value + currentW/2), canvasH/2 - (currentBounds[1].value + currentH/2));
+            smartDoc.save();
+            smartDoc.close();
+            var opts = new ExportOptionsSaveForWeb();
+            opts.format = SaveDocumentType.JPEG;
+            opts.quality = 90;
+            mainDoc.exportDocument(outFile, ExportType.SAVEFORWEB, opts);
+        }
+        mainDoc.close(SaveOptions.DONOTSAVECHANGES);
+        return "OK";
+    } catch(e) {
+        while(app.documents.length > 0) {
+            app.activeDocument.close(SaveOptions.DONOTSAVECHANGES);
+        }
+        return String(e);
+    }
+}
+"""
+
+# Constant script prelude, assembled once at import time
+_JSX_PRELUDE = """
 #target photoshop
 app.displayDialogs = DialogModes.NO;
-try {{
-    var mainDoc = app.open(new File("{_jsx(psd)}"));
-    var artFile = new File("{_jsx(art)}");
-    var outFile = new File("{_jsx(out)}");
-
-    function findLayer(container) {{
-        for (var i = 0; i < container.layers.length; i++) {{
-            var l = container.layers[i];
-            if (l.typename === "ArtLayer") {{
-                var n = l.name.toUpperCase();
-                if (n.indexOf("DESIGN") !== -1 || n.indexOf("ARTWORK") !== -1 || n.indexOf("PLACE") !== -1) return l;
-            }} else if (l.typename === "LayerSet") {{
-                var f = findLayer(l);
-                if (f) return f;
-            }}
-        }}
-        return null;
-    }}
-
-    var target = findLayer(mainDoc);
-    if(target && target.kind == LayerKind.SMARTOBJECT) {{
-        mainDoc.activeLayer = target;
-        var idplacedLayerEditContents = stringIDToTypeID("placedLayerEditContents");
-        executeAction(idplacedLayerEditContents, new ActionDescriptor(), DialogModes.NO);
-        var smartDoc = app.activeDocument;
-        smartDoc.activeLayer.isBackgroundLayer ? null : smartDoc.artLayers.add(); 
-        var idPlc = charIDToTypeID("Plc ");
-        var desc = new ActionDescriptor();
-        desc.putPath(charIDToTypeID("null"), artFile);
-        desc.putEnumerated(charIDToTypeID("FTcs"), charIDToTypeID("QCSt"), charIDToTypeID("Qcsa"));
-        executeAction(idPlc, desc, DialogModes.NO);
-        var artLayer = smartDoc.activeLayer;
-        var artW = artLayer.bounds[2].value - artLayer.bounds[0].value;
-        var artH = artLayer.bounds[3].value - artLayer.bounds[1].value;
-        var canvasW = smartDoc.width.value;
-        var canvasH = smartDoc.height.value;
-        var scaleX = (canvasW / artW) * 100;
-        var scaleY = (canvasH / artH) * 100;
-        var scale = Math.max(scaleX, scaleY); 
-        artLayer.resize(scale, scale, AnchorPosition.MIDDLECENTER);
-        var currentBounds = artLayer.bounds;
-        var currentW = currentBounds[2].value - currentBounds[0].value;
-        var currentH = currentBounds[3].value - currentBounds[1].value;
-        artLayer.translate(canvasW/2 - (currentBounds[0].value + currentW/2), canvasH/2 - (currentBounds[1].value + currentH/2));
-        smartDoc.save();
-        smartDoc.close();
-        var opts = new ExportOptionsSaveForWeb();
-        opts.format = SaveDocumentType.JPEG;
-        opts.quality = 90;
-        mainDoc.exportDocument(outFile, ExportType.SAVEFORWEB, opts);
-    }}
-    mainDoc.close(SaveOptions.DONOTSAVECHANGES);
-}} catch(e) {{
-    while(app.documents.length > 0) {{
-        app.activeDocument.close(SaveOptions.DONOTSAVECHANGES);
-    }}
+""" + _JSX_PROCESS_JOB
+
+# Per-call parts - only the quoted paths are substituted
+_JSX_SINGLE_CALL = """processJob({psd}, {art}, {out});
+"""
+_JSX_BATCH_ROW = "    [{psd}, {art}, {out}]"
+_JSX_BATCH_LOOP = """var jobs = [
+{jobs}
+];
+var logFile = new File({log});
+logFile.encoding = "UTF-8";
+for (var j = 0; j < jobs.length; j++) {{
+    var status = processJob(jobs[j][0], jobs[j][1], jobs[j][2]);
+    // Reopen per job so each line reaches disk as soon as the job ends
+    logFile.open("a");
+    logFile.writeln(j + "|" + status);
+    logFile.close();
 }}
 """
 
+def build_jsx(psd, art, out):
+    return _JSX_PRELUDE + _JSX_SINGLE_CALL.format(psd=_js_str(psd), art=_js_str(art), out=_js_str(out))
+
+def build_batch_jsx(jobs, log_path):
+    """
+    Build one JSX that renders every (psd, art, out) job in a single DoJavaScript call.
+    processJob is defined once and called per job, and one "<index>|<status>" line
+    per job is written to log_path for per-file reporting.
+    """
+    rows = ",\n".join(
+        _JSX_BATCH_ROW.format(psd=_js_str(psd), art=_js_str(art), out=_js_str(out)) for psd, art, out in jobs
+    )
+    return _JSX_PRELUDE + _JSX_BATCH_LOOP.format(jobs=rows, log=_js_str(log_path))
+
+# Fingerprint of the render logic - part of every ResultCache key so editing
+# the JSX automatically invalidates previously cached renders
+_JSX_FINGERPRINT = hashlib.blake2b(_JSX_PRELUDE.encode(), digest_size=8).hexdigest()
+
+class PhotoshopSession:
+    """
+    A single Photoshop COM connection reused for a whole batch, so the
+    Dispatch round-trip is paid once instead of once per mockup.
+    """
+    
+    def __init__(self):
+        self.ps = None
+    
+    def connect(self):
+        """Attach to Photoshop. Raises exception if Photoshop is not available."""
+        if self.ps is None:
+            self.ps = win32com.client.Dispatch("Photoshop.Application")
+            self.ps.Visible = False
+        return self
+    
+    def __enter__(self):
+        return self.connect()
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Leave Photoshop running - nothing to release on our side
+        return False
+    
+    def render(self, psd, art, out):
+        """Render a single mockup"""
+        self.ps.DoJavaScript(build_jsx(psd, art, out))
+    
+    def render_batch(self, jobs, log_path):
+        """
+        Render all (psd, art, out) jobs with one DoJavaScript call.
+        Each finished job appends "<index>|<status>" to log_path (see read_render_log),
+        including the jobs completed before a failure of the call itself.
+        """
+        self.ps.DoJavaScript(build_batch_jsx(jobs, log_path))
+
+def read_render_log(log_path):
+    """Parse a batch JSX log into {job index: status} ("OK" or the error)"""
+    results = {}
+    try:
+        with open(log_path, 'r', encoding='utf-8-sig') as f:
+            for line in f:
+                # A line without its newline may still be being written
+                if not line.endswith('\n'):
+                    break
+                index, _, status = line.rstrip('\r\n').partition('|')
+                if index.isdigit():
+                    results[int(index)] = status
+    except OSError as e:
+        print(f"Could not read render log {log_path}: {e}")
+    return results
+
 def render(psd, art, out):
     """Render a mockup. Raises exception if Photoshop is not available."""
-    ps = win32com.client.Dispatch("Photoshop.Application")
-    ps.Visible = False 
-    ps.DoJavaScript(build_jsx(psd, art, out))
+    with PhotoshopSession() as session:
+        session.render(psd, art, out)
 
 @dataclass
 class Job:
     psds: List[str]
     art: str
     out_dir: str
+    cache_dir: Optional[str] = None  # Enables ResultCache when set
+
+class ResultCache:
+    """
+    Cache of finished renders keyed by everything that affects the output
+    (PSD, artwork, their mtimes and the JSX template), so re-running a batch
+    only sends new or changed pairs to Photoshop.
+    Files live in <cache_dir>/renders/<key>.jpg with an index.json sidecar.
+    The index is kept in least-recently-used order and trimmed to MAX_ENTRIES on save().
+    """
+    
+    DIR_NAME = "renders"
+    MAX_ENTRIES = 200  # Oldest renders beyond this are deleted
+    
+    def __init__(self, cache_dir):
+        self.render_dir = os.path.join(cache_dir, self.DIR_NAME)
+        self.index_file = os.path.join(self.render_dir, "index.json")
+        self.index = {}
+        try:
+            os.makedirs(self.render_dir, exist_ok=True)
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        except FileNotFoundError:
+            pass  # First run - empty index
+        except Exception as e:
+            print(f"Could not load render cache: {e}")
+    
+    def make_key(self, psd, art):
+        """Hash the render inputs; returns None if either file can't be stat'd"""
+        try:
+            psd_mtime = os.stat(psd).st_mtime_ns
+            art_mtime = os.stat(art).st_mtime_ns
+        except OSError:
+            return None
+        key_source = f"{os.path.abspath(psd)}|{psd_mtime}|{os.path.abspath(art)}|{art_mtime}|{_JSX_FINGERPRINT}"
+        return hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+    
+    def fetch(self, key, out):
+        """Copy a cached render to out. Returns True on a cache hit"""
+        filename = self.index.get(key)
+        if not filename:
+            return False
+        try:
+            shutil.copy2(os.path.join(self.render_dir, filename), out)
+            # Move to the end - most recently used renders are evicted last
+            self.index[key] = self.index.pop(key)
+            return True
+        except OSError:
+            # Cached file went missing - forget it and render again
+            self.index.pop(key, None)
+            return False
+    
+    def store(self, key, out):
+        """Keep a copy of a finished render (skipped if Photoshop produced nothing).
+        The index is only written by save()"""
+        if not os.path.exists(out):
+            return
+        filename = f"{key}.jpg"
+        try:
+            shutil.copy2(out, os.path.join(self.render_dir, filename))
+            self.index.pop(key, None)
+            self.index[key] = filename
+        except Exception as e:
+            print(f"Could not cache render {out}: {e}")
+    
+    def save(self):
+        """Evict the least recently used renders over MAX_ENTRIES, then write the index"""
+        while len(self.index) > self.MAX_ENTRIES:
+            oldest = next(iter(self.index))
+            filename = self.index.pop(oldest)
+            try:
+                os.remove(os.path.join(self.render_dir, filename))
+            except OSError:
+                pass  # Already gone
+        try:
+            with open(self.index_file, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f)
+        except Exception as e:
+            print(f"Could not save render cache index: {e}")
 
 class Worker(QThread):
     progress = pyqtSignal(int)
@@ -720,15 +1076,49 @@ class Worker(QThread):
     finished = pyqtSignal()
     error = pyqtSignal(str)  # New signal for errors
     
+    # Minimum seconds between progress signals sent to the UI thread
+    PROGRESS_INTERVAL = 0.05
+    # Seconds between reads of the batch log while Photoshop works
+    LOG_POLL_INTERVAL = 0.25
+    
     def __init__(self, job):
         super().__init__()
         self.job = job
+        self._last_pct = -1
+        self._last_emit = 0.0
+    
+    def _report_progress(self, done, total):
+        """Emit progress only when the percentage changes, at most every PROGRESS_INTERVAL"""
+        pct = (done * 100) // total
+        now = time.monotonic()
+        if pct != self._last_pct and now - self._last_emit > self.PROGRESS_INTERVAL:
+            self.progress.emit(pct)
+            self._last_pct = pct
+            self._last_emit = now
+    
+    def _report_batch_results(self, results, pending, reported, done, total):
+        """Log and count jobs that finished since the last look at the batch log; returns the new done count"""
+        for index in sorted(results.keys() - reported):
+            reported.add(index)
+            status = results[index]
+            if status != "OK":
+                self.log.emit(f"❌ Error processing {pending[index][2]}: {status}")
+            done += 1
+            self._report_progress(done, total)
+            if index + 1 < len(pending) and index + 1 not in results:
+                self.log.emit(f"Processing: {pending[index + 1][2]}")
+        return done
+    
+    def _poll_batch_log(self, log_path, pending, reported, done, total, stop):
+        """Thread body: report per-file progress from the batch log while DoJavaScript blocks"""
+        while not stop.wait(self.LOG_POLL_INTERVAL):
+            done = self._report_batch_results(read_render_log(log_path), pending, reported, done, total)
         
     def run(self):
         # First, check if Photoshop is available before processing any mockups
+        session = PhotoshopSession()
         try:
-            ps = win32com.client.Dispatch("Photoshop.Application")
-            ps_available = True
+            session.connect()
         except Exception as e:
             self.log.emit("=" * 60)
             self.log.emit("❌ ERROR: Adobe Photoshop not found!")
@@ -748,25 +1138,179 @@ class Worker(QThread):
         total = len(self.job.psds)
         self.log.emit(f"✓ Photoshop detected - Processing {total} mockup(s)...")
         
-        for i, psd in enumerate(self.job.psds, start=1):
+        # List the output folder once instead of stat-ing every candidate name
+        existing = list_existing_filenames(self.job.out_dir)
+        cache = ResultCache(self.job.cache_dir) if self.job.cache_dir else None
+        
+        # Resolve output names and serve cache hits first; everything else is
+        # sent to Photoshop as a single batch
+        pending = []
+        done = 0
+        for psd in self.job.psds:
             name = os.path.splitext(os.path.basename(psd))[0] + ".jpg"
             out = os.path.join(self.job.out_dir, name)
             
             # Get unique filepath to avoid overwriting
-            out = get_unique_filepath(out)
+            out = get_unique_filepath(out, existing)
             final_name = os.path.basename(out)
             
-            self.log.emit(f"Processing: {final_name}")
+            # Identical (psd, art) pair rendered before - reuse it, skip Photoshop
+            key = cache.make_key(psd, self.job.art) if cache else None
+            if key and cache.fetch(key, out):
+                self.log.emit(f"✓ Reused previous render for {final_name}")
+                done += 1
+                self._report_progress(done, total)
+            else:
+                pending.append((psd, out, final_name, key))
+        
+        if pending:
+            self.log.emit(f"Processing: {pending[0][2]}")
+            
+            fd, log_path = tempfile.mkstemp(prefix="mockupcore_", suffix=".log")
+            os.close(fd)
+            batch_error = "Not processed"
+            
+            # The batch is one blocking call - a side thread follows its log for progress
+            reported = set()
+            stop = threading.Event()
+            poller = threading.Thread(
+                target=self._poll_batch_log, args=(log_path, pending, reported, done, total, stop), daemon=True
+            )
+            poller.start()
             try:
-                render(psd, self.job.art, out)
+                with session:
+                    session.render_batch([(psd, self.job.art, out) for psd, out, _, _ in pending], log_path)
             except Exception as e:
-                self.log.emit(f"❌ Error processing {final_name}: {str(e)}")
-            self.progress.emit(int((i / total) * 100))
+                batch_error = str(e)
+            finally:
+                stop.set()
+                poller.join()
+                # Read the log even if the call failed - jobs before the failure did render
+                results = read_render_log(log_path)
+                try:
+                    os.remove(log_path)
+                except OSError:
+                    pass
+            
+            done += len(reported)
+            done = self._report_batch_results(results, pending, reported, done, total)
+            for index, (psd, out, final_name, key) in enumerate(pending):
+                status = results.get(index)
+                if status == "OK":
+                    if key:
+                        cache.store(key, out)
+                elif status is None:
+                    # Never reached - the batch call failed before this job
+                    self.log.emit(f"❌ Error processing {final_name}: {batch_error}")
+                    done += 1
+                    self._report_progress(done, total)
+        
+        # One index write for the whole batch (also records cache-hit recency)
+        if cache:
+            cache.save()
+        
+        # Throttling may have skipped the last step
+        self.progress.emit(100)
         self.finished.emit()
 
+class InitWorker(QThread):
+    """Scans the library and fetches cloud mockups off the GUI thread"""
+    status = pyqtSignal(str, str)
+    progress = pyqtSignal(int)
+    mockups_ready = pyqtSignal(list)
+    
+    def __init__(self, library):
+        super().__init__()
+        self.library = library
+    
+    def run(self):
+        mockups = self.library.get_all_mockups(self.status.emit, self.progress.emit)
+        self.mockups_ready.emit(mockups)
+
+class RefreshWorker(InitWorker):
+    """InitWorker that clears the cloud cache first, so cloud mockups are re-downloaded"""
+    cache_cleared = pyqtSignal(bool)
+    
+    def run(self):
+        # Without cloud sources there is nothing to re-download - keep the cache
+        if self.library.cloud_urls:
+            self.status.emit("Clearing cache...", "")
+            self.cache_cleared.emit(self.library.clear_cache())
+        super().run()
+
+# Google Drive folder links (incl. /drive/u/<n>/folders/), capturing the folder ID
+_GDRIVE_FOLDER_RE = re.compile(r'drive\.google\.com/(?:drive/(?:u/\d+/)?folders)/([A-Za-z0-9_-]+)')
+
+# Google Drive file links (/file/d/<id>/... or ?id=<id>), capturing the file ID
+_GDRIVE_RE = re.compile(r'(?:/file/d/|[?&]id=)([^/&?]+)')
+
+# Cloud URL helpers are pure functions of the URL, memoized for the process lifetime
+@functools.lru_cache(maxsize=2048)
+def _drive_direct(url):
+    """Convert Google Drive sharing link to direct download link"""
+    if 'drive.google.com' not in url:
+        return url
+    
+    # Extract file ID from various Google Drive URL formats
+    match = _GDRIVE_RE.search(url)
+    if not match:
+        return url
+    
+    # Return direct download link
+    return f"https://drive.google.com/uc?export=download&id={match.group(1)}"
+
+@functools.lru_cache(maxsize=2048)
+def _cached_filename(url):
+    """Generate a safe filename for cached file based on URL"""
+    # Use a 64-bit fingerprint of the URL as filename to avoid conflicts
+    url_hash = hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
+    # Try to get original filename from URL
+    original_name = url.rsplit('/', 1)[-1].split('?', 1)[0]
+    if original_name.lower().endswith('.psd'):
+        return f"{url_hash}_{original_name}"
+    else:
+        return f"{url_hash}.psd"
+
+# Default cloud_sources.txt, pre-encoded so creating it is a single write
+_CLOUD_TEMPLATE_BYTES = b"""# Cloud Mockup Library Configuration
+# Add one URL per line to load mockups from cloud storage
+# 
+# Supported formats:
+# - Direct URL: https://example.com/path/to/mockup.psd
+# - Google Drive file: https://drive.google.com/file/d/FILE_ID/view
+#   (To get FILE_ID: Right-click file > Share > Copy link)
+# - Google Drive folder: https://drive.google.com/drive/folders/FOLDER_ID
+#   (Automatically loads ALL .psd files from the folder)
+#
+# Example:
+# https://drive.google.com/drive/folders/1TXJ2FNU-ntSF4hwxmorJA3hd9TblePcf
+# https://drive.google.com/file/d/1abc123def456/view
+# https://www.dropbox.com/s/abc123/mockup.psd?dl=1
+# https://example.com/mockups/design1.psd
+"""
+
+def _parse_cloud_sources_bytes(data: bytes) -> List[str]:
+    """Return the non-empty, non-comment lines of a cloud_sources.txt payload"""
+    # Notepad saves UTF-8 with a BOM
+    if data[:3] == b'\xef\xbb\xbf':
+        data = data[3:]
+    lines = []
+    for raw in data.splitlines():
+        line = raw.strip()
+        # Skip empty lines and comments
+        if not line or line[:1] == b'#':
+            continue
+        lines.append(line.decode('utf-8'))
+    return lines
+
 class MockupLibrary:
     """Handles the mockup library system with cloud storage support"""
     
+    # Concurrent cloud downloads (network-bound)
+    DOWNLOAD_WORKERS = 16
+    DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+    DOWNLOAD_TIMEOUT = 30  # seconds without data before a download is abandoned
+    
     def __init__(self):
         # FIXED: Use a persistent location that survives .exe restarts
         # Instead of using resource_path (which extracts to temp), 
@@ -780,20 +1324,32 @@ class MockupLibrary:
             self.library_root = resource_path("mockup_library")
         
         self.cache_dir = os.path.join(self.library_root, "_cache")
+        # Extracted PSD thumbnails, kept apart from the downloaded cloud PSDs
+        self.thumb_cache_dir = os.path.join(self.cache_dir, "thumbs")
         self._ensure_library_structure()
         
+        # Worker pool for thumbnail extraction (I/O-bound, file reads release the GIL)
+        self.thumbnail_pool = ThreadPoolExecutor(max_workers=8)
+        # Thumbnail extractions started as soon as a cloud download lands: {psd_path: Future}
+        self._thumbnail_prefetch = {}
+        
+        # Finished thumbnails are shared across widgets through QPixmapCache (KB)
+        QPixmapCache.setCacheLimit(65536)
+        
         # Cloud configuration file
         self.cloud_config_file = os.path.join(self.library_root, "cloud_sources.txt")
         self.cloud_urls = self._load_cloud_sources()
+        
+        # Last local library walk: ({folder: mtime_ns}, psd paths)
+        self._walk_cache: Optional[Tuple[dict, List[str]]] = None
     
     def _ensure_library_structure(self):
         """Create the library folder and cache if they don't exist"""
-        for folder in [self.library_root, self.cache_dir]:
-            if not os.path.exists(folder):
-                try:
-                    os.makedirs(folder)
-                except Exception as e:
-                    print(f"Could not create folder {folder}: {e}")
+        for folder in [self.library_root, self.cache_dir, self.thumb_cache_dir]:
+            try:
+                os.makedirs(folder, exist_ok=True)
+            except Exception as e:
+                print(f"Could not create folder {folder}: {e}")
     
     def _load_cloud_sources(self):
         """
@@ -806,74 +1362,44 @@ class MockupLibrary:
         """
         urls = []
         
-        if os.path.exists(self.cloud_config_file):
-            try:
-                with open(self.cloud_config_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        # Skip empty lines and comments
-                        if line and not line.startswith('#'):
-                            # Check if it's a Google Drive folder
-                            if 'drive.google.com/drive/folders' in line or 'drive.google.com/drive/u/' in line and 'folders' in line:
-                                # Extract folder ID and get all PSDs from folder
-                                folder_urls = self._get_files_from_gdrive_folder(line)
-                                urls.extend(folder_urls)
-                            else:
-                                # Single file URL
-                                urls.append(line)
-            except Exception as e:
-                print(f"Error loading cloud sources: {e}")
-        else:
+        try:
+            with open(self.cloud_config_file, 'rb') as f:
+                data = f.read()
+            for line in _parse_cloud_sources_bytes(data):
+                # Check if it's a Google Drive folder
+                folder_match = _GDRIVE_FOLDER_RE.search(line)
+                if folder_match:
+                    # Get all PSDs from folder
+                    folder_urls = self._get_files_from_gdrive_folder(folder_match.group(1))
+                    urls.extend(folder_urls)
+                else:
+                    # Single file URL
+                    urls.append(line)
+        except FileNotFoundError:
             # Create template file
             self._create_cloud_config_template()
+        except Exception as e:
+            print(f"Error loading cloud sources: {e}")
         
         return urls
     
     def _create_cloud_config_template(self):
         """Create a template cloud_sources.txt file with instructions"""
-        template = """# Cloud Mockup Library Configuration
-# Add one URL per line to load mockups from cloud storage
-# 
-# Supported formats:
-# - Direct URL: https://example.com/path/to/mockup.psd
-# - Google Drive file: https://drive.google.com/file/d/FILE_ID/view
-#   (To get FILE_ID: Right-click file > Share > Copy link)
-# - Google Drive folder: https://drive.google.com/drive/folders/FOLDER_ID
-#   (Automatically loads ALL .psd files from the folder)
-#
-# Example:
-# https://drive.google.com/drive/folders/1TXJ2FNU-ntSF4hwxmorJA3hd9TblePcf
-# https://drive.google.com/file/d/1abc123def456/view
-# https://www.dropbox.com/s/abc123/mockup.psd?dl=1
-# https://example.com/mockups/design1.psd
-"""
         try:
-            with open(self.cloud_config_file, 'w', encoding='utf-8') as f:
-                f.write(template)
+            with open(self.cloud_config_file, 'wb') as f:
+                f.write(_CLOUD_TEMPLATE_BYTES)
         except Exception as e:
             print(f"Could not create cloud config template: {e}")
     
-    def _get_files_from_gdrive_folder(self, folder_url):
+    def _get_files_from_gdrive_folder(self, folder_id):
         """
         Extract all PSD file links from a public Google Drive folder using Drive API.
         Works without authentication for publicly shared folders.
+        folder_id is the ID captured by _GDRIVE_FOLDER_RE.
         """
-        import urllib.request
-        import urllib.error
-        import json
-        
         file_urls = []
         
         try:
-            # Extract folder ID from various URL formats
-            folder_id = None
-            if '/folders/' in folder_url:
-                folder_id = folder_url.split('/folders/')[-1].split('?')[0].split('/')[0]
-            
-            if not folder_id:
-                print(f"Could not extract folder ID from: {folder_url}")
-                return file_urls
-            
             print(f"📁 Fetching PSDs from Google Drive folder: {folder_id}")
             
             # Use Google Drive API v3 to list files
@@ -897,7 +1423,7 @@ class MockupLibrary:
             print("     3. Use Dropbox or direct URLs instead")
             
             # Store folder URL for reference
-            file_urls.append(f"# FOLDER: {folder_url}")
+            file_urls.append(f"# FOLDER: https://drive.google.com/drive/folders/{folder_id}")
             file_urls.append("# Please replace this with individual file URLs")
             file_urls.append("# Right-click each file > Share > Copy link")
             
@@ -906,54 +1432,41 @@ class MockupLibrary:
         
         return file_urls
     
-    def _get_google_drive_direct_link(self, url):
-        """Convert Google Drive sharing link to direct download link"""
-        if 'drive.google.com' in url:
-            # Extract file ID from various Google Drive URL formats
-            if '/file/d/' in url:
-                file_id = url.split('/file/d/')[1].split('/')[0]
-            elif 'id=' in url:
-                file_id = url.split('id=')[1].split('&')[0]
-            else:
-                return url
-            
-            # Return direct download link
-            return f"https://drive.google.com/uc?export=download&id={file_id}"
-        return url
-    
-    def _get_cached_filename(self, url):
-        """Generate a safe filename for cached file based on URL"""
-        import hashlib
-        # Use hash of URL as filename to avoid conflicts
-        url_hash = hashlib.md5(url.encode()).hexdigest()
-        # Try to get original filename from URL
-        original_name = url.split('/')[-1].split('?')[0]
-        if original_name.lower().endswith('.psd'):
-            return f"{url_hash}_{original_name}"
-        else:
-            return f"{url_hash}.psd"
-    
     def _download_file(self, url, destination):
         """Download a file from URL to destination"""
-        import urllib.request
-        import urllib.error
-        
+        # Download into a .part file and rename it into place only once complete,
+        # so an interrupted download is never mistaken for a cached mockup
+        part_path = destination + ".part"
         try:
             # Convert Google Drive links
-            download_url = self._get_google_drive_direct_link(url)
+            download_url = _drive_direct(url)
             
-            # Download with progress (basic)
+            # Stream straight to disk in large chunks (urlretrieve copies 8 KB at a time)
             print(f"Downloading from cloud: {url}")
-            urllib.request.urlretrieve(download_url, destination)
+            with urllib.request.urlopen(download_url, timeout=self.DOWNLOAD_TIMEOUT) as response:
+                with open(part_path, 'wb') as f:
+                    # Reserve the space up front when the size is known (POSIX only)
+                    length = int(response.headers.get('Content-Length') or 0)
+                    if length and hasattr(os, 'posix_fallocate'):
+                        try:
+                            os.posix_fallocate(f.fileno(), 0, length)
+                        except OSError:
+                            pass
+                    shutil.copyfileobj(response, f, self.DOWNLOAD_CHUNK_SIZE)
+            os.replace(part_path, destination)
             return True
         except urllib.error.URLError as e:
             print(f"Download failed for {url}: {e}")
-            return False
         except Exception as e:
             print(f"Error downloading {url}: {e}")
-            return False
+        
+        try:
+            os.remove(part_path)
+        except OSError:
+            pass
+        return False
     
-    def _get_cloud_mockups(self, progress_callback=None, splash=None):
+    def _get_cloud_mockups(self, progress_callback=None, progress_value_callback=None):
         """Download and cache cloud mockups, return list of local paths"""
         cloud_psds = []
         total_urls = len(self.cloud_urls)
@@ -961,110 +1474,244 @@ class MockupLibrary:
         if total_urls == 0:
             return cloud_psds
         
-        downloads_needed = 0
-        cached_count = 0
-        
-        # First pass - check what needs downloading
+        # One listing of the cache folder instead of an existence check per URL
+        existing = list_existing_filenames(self.cache_dir)
+        plan = []
+        planned = set()
         for url in self.cloud_urls:
-            cache_filename = self._get_cached_filename(url)
+            cache_filename = _cached_filename(url)
+            # A URL listed twice (or a folder listing repeating a direct link) maps to the
+            # same cache file - plan it once so two threads never write the same .part file
+            if os.path.normcase(cache_filename) in planned:
+                continue
+            planned.add(os.path.normcase(cache_filename))
             cache_path = os.path.join(self.cache_dir, cache_filename)
-            if not os.path.exists(cache_path):
-                downloads_needed += 1
+            plan.append((url, cache_path, os.path.normcase(cache_filename) in existing))
+        total_urls = len(plan)
+        
+        missing = [(url, cache_path) for url, cache_path, cached in plan if not cached]
+        downloads_needed = len(missing)
+        cached_count = 0
         
         if downloads_needed == 0:
             print(f"✓ All {total_urls} cloud mockups already cached - loading instantly")
         else:
             print(f"Downloading {downloads_needed} new cloud mockup(s), {total_urls - downloads_needed} already cached")
         
-        for i, url in enumerate(self.cloud_urls, 1):
-            cache_filename = self._get_cached_filename(url)
-            cache_path = os.path.join(self.cache_dir, cache_filename)
+        # Cached mockups are used as-is; missing ones go to the download pool
+        for i, (url, cache_path, cached) in enumerate(plan, 1):
+            if not cached:
+                continue
             
-            # If not in cache, download it
-            if not os.path.exists(cache_path):
-                if progress_callback:
-                    progress_callback(f"Downloading cloud mockup {i} of {total_urls}...", "")
-                
-                # Update progress bar if splash is provided
-                if splash:
-                    progress_percent = int((i / total_urls) * 100)
-                    splash.set_progress_value(progress_percent)
-                
-                print(f"⬇ Downloading: {cache_filename}")
-                if self._download_file(url, cache_path):
-                    cloud_psds.append(cache_path)
-            else:
-                # Use cached version - much faster!
-                if progress_callback:
-                    progress_callback(f"Loading cached mockup {i} of {total_urls}...", "")
-                
-                # Update progress bar if splash is provided
-                if splash:
-                    progress_percent = int((i / total_urls) * 100)
-                    splash.set_progress_value(progress_percent)
+            # Use cached version - much faster!
+            if progress_callback:
+                progress_callback(f"Loading cached mockup {i} of {total_urls}...", "")
+            
+            # Update progress bar if a callback is provided
+            if progress_value_callback:
+                progress_value_callback(int((cached_count + 1) / total_urls * 100))
+            
+            cloud_psds.append(cache_path)
+            cached_count += 1
+        
+        # Downloads are network-bound, so fetch them concurrently
+        if missing:
+            completed = cached_count
+            with ThreadPoolExecutor(max_workers=min(self.DOWNLOAD_WORKERS, len(missing))) as pool:
+                futures = {}
+                for url, cache_path in missing:
+                    print(f"⬇ Downloading: {os.path.basename(cache_path)}")
+                    futures[pool.submit(self._download_file, url, cache_path)] = cache_path
                 
-                cloud_psds.append(cache_path)
-                cached_count += 1
+                for future in as_completed(futures):
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(f"Downloading cloud mockup {completed} of {total_urls}...", "")
+                    if progress_value_callback:
+                        progress_value_callback(int((completed / total_urls) * 100))
+                    
+                    if future.result():
+                        cache_path = futures[future]
+                        cloud_psds.append(cache_path)
+                        # Extract its thumbnail while the remaining downloads run
+                        self._thumbnail_prefetch[cache_path] = self.thumbnail_pool.submit(
+                            self.get_thumbnail_bytes, cache_path)
         
         if cached_count > 0:
             print(f"✓ Loaded {cached_count} mockup(s) from cache (instant)")
         
         return cloud_psds
     
-    def get_all_mockups(self, progress_callback=None, splash=None):
+    def _scan_local_mockups(self):
+        """Walk the library folder for PSDs, reusing the last walk while no folder has changed"""
+        # Adding, removing or renaming an entry bumps its parent folder's mtime,
+        # so unchanged folder mtimes mean an unchanged PSD list
+        if self._walk_cache is not None:
+            dir_mtimes, cached_files = self._walk_cache
+            try:
+                if all(os.stat(folder).st_mtime_ns == mtime for folder, mtime in dir_mtimes.items()):
+                    return list(cached_files)
+            except OSError:
+                pass
+        
+        dir_mtimes = {}
+        psd_files = []
+        
+        def scan(folder):
+            # scandir entries carry their type, so files aren't stat'd a second time
+            try:
+                dir_mtimes[folder] = os.stat(folder).st_mtime_ns
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Skip the cache directory (pruned as a whole)
+                            if entry.name != '_cache':
+                                scan(entry.path)
+                        # Only include .psd files, skip config files
+                        elif (entry.name.lower().endswith('.psd') and entry.name != 'cloud_sources.txt'
+                              and entry.is_file()):
+                            psd_files.append(entry.path)
+            except OSError:
+                pass
+        
+        scan(self.library_root)
+        self._walk_cache = (dir_mtimes, psd_files) if dir_mtimes else None
+        return list(psd_files)
+    
+    def get_all_mockups(self, progress_callback=None, progress_value_callback=None):
         """Returns all PSD files from both local library and cloud sources"""
         psd_files = []
         
         if progress_callback:
             progress_callback("Scanning local library...", "")
         
-        # Get local PSDs (excluding cache folder and config file)
-        if os.path.exists(self.library_root):
-            for root, dirs, files in os.walk(self.library_root):
-                # Skip the cache directory
-                if '_cache' in root:
-                    continue
-                    
-                for file in files:
-                    # Only include .psd files, skip config files
-                    if file.lower().endswith('.psd') and file != 'cloud_sources.txt':
-                        psd_files.append(os.path.join(root, file))
+        # Get local PSDs (excluding cache folder and config file) - a missing
+        # library folder just scans as empty
+        psd_files.extend(self._scan_local_mockups())
         
         if progress_callback:
             progress_callback("Loading cloud mockups...", "")
         
-        # Get cloud PSDs (cached locally) - pass splash for progress updates
+        # Get cloud PSDs (cached locally) - pass the callbacks on for download progress
         try:
-            cloud_psds = self._get_cloud_mockups(progress_callback, splash)
+            cloud_psds = self._get_cloud_mockups(progress_callback, progress_value_callback)
             psd_files.extend(cloud_psds)
         except Exception as e:
             print(f"Error loading cloud mockups: {e}")
         
-        return sorted(psd_files)
+        psd_files.sort()
+        return psd_files
+    
+    def get_thumbnail_bytes(self, psd_path):
+        """
+        Return the embedded PSD thumbnail as JPEG bytes, using the on-disk cache when possible.
+        Cache entries are keyed by (path, mtime, size) so edited PSDs are re-parsed.
+        No Qt calls, so this runs on the thumbnail worker pool.
+        """
+        try:
+            st = os.stat(psd_path)
+        except OSError:
+            return None
+        
+        key_source = f"{os.path.abspath(psd_path)}|{st.st_mtime_ns}|{st.st_size}"
+        key = hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+        cache_path = os.path.join(self.thumb_cache_dir, f"{key}.jpg")
+        
+        # Cache hit - return the stored JPEG directly
+        try:
+            with open(cache_path, 'rb') as f:
+                return f.read()
+        except OSError:
+            pass
+        
+        # Cache miss - parse the PSD and store the result
+        jpeg_data = extract_psd_thumbnail_bytes(psd_path)
+        if jpeg_data:
+            try:
+                tmp_path = cache_path + ".tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(jpeg_data)
+                os.replace(tmp_path, cache_path)
+            except Exception as e:
+                print(f"Could not cache thumbnail for {psd_path}: {e}")
+        return jpeg_data
+    
+    def get_thumbnail(self, psd_path):
+        """Return the embedded PSD thumbnail as a QImage"""
+        return image_from_jpeg(self.get_thumbnail_bytes(psd_path))
+    
+    def _thumbnail_job(self, psd_path, prepare):
+        """Worker-pool task: extract (or load cached) thumbnail bytes, then run prepare on them"""
+        # Only wait on a prefetch a pool thread has already picked up (cancel() fails
+        # once it runs). One still queued - e.g. submitted by a refresh after this
+        # task - sits behind tasks like this one, and waiting could block the pool
+        prefetched = self._thumbnail_prefetch.pop(psd_path, None)
+        if prefetched is not None and prefetched.cancel():
+            prefetched = None
+        jpeg_data = prefetched.result() if prefetched else self.get_thumbnail_bytes(psd_path)
+        return prepare(jpeg_data) if prepare else jpeg_data
+    
+    def load_thumbnails_async(self, psd_paths, on_ready, prepare=None):
+        """
+        Extract thumbnails for all PSDs on the worker pool.
+        prepare(jpeg_bytes) optionally post-processes each one on the pool as well
+        (e.g. decoding it), and on_ready(psd_path, result) is called from the worker
+        thread as each one finishes (result is None on failure), so it should emit
+        a signal rather than touch widgets directly.
+        """
+        def done(fut, psd_path):
+            # Cancelled when the pool shuts down - exception()/result() would raise
+            if fut.cancelled():
+                return
+            on_ready(psd_path, None if fut.exception() else fut.result())
+        
+        for psd_path in psd_paths:
+            future = self.thumbnail_pool.submit(self._thumbnail_job, psd_path, prepare)
+            future.add_done_callback(functools.partial(done, psd_path=psd_path))
     
     def get_library_path(self):
         """Returns the library root path"""
         return self.library_root
     
     def clear_cache(self):
-        """Clear the cloud cache folder"""
-        import shutil
+        """Clear the cloud cache folder (finished renders are kept)"""
+        self._thumbnail_prefetch = {}
         try:
-            if os.path.exists(self.cache_dir):
-                shutil.rmtree(self.cache_dir)
-                os.makedirs(self.cache_dir)
-                print("Cloud cache cleared")
-                return True
+            # Empty the folder in place instead of deleting and recreating it
+            try:
+                with os.scandir(self.cache_dir) as it:
+                    entries = list(it)
+            except FileNotFoundError:
+                entries = []
+            for entry in entries:
+                # Render cache keys already include the input mtimes - nothing to invalidate
+                if entry.name == ResultCache.DIR_NAME:
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.remove(entry.path)
+                except FileNotFoundError:
+                    pass  # Already gone
+            os.makedirs(self.thumb_cache_dir, exist_ok=True)
+            print("Cloud cache cleared")
+            return True
         except Exception as e:
             print(f"Error clearing cache: {e}")
         return False
     
     def refresh_cloud_mockups(self):
         """Force re-download of all cloud mockups"""
+        # Nothing to re-download - keep the cache (and its thumbnails)
+        if not self.cloud_urls:
+            return []
         self.clear_cache()
         return self._get_cloud_mockups()
 
 class MainWindow(QMainWindow):
+    thumbnail_ready = pyqtSignal(str, object)  # (path, tile QImage or None) from the thumbnail worker pool
+    
     def __init__(self):
         super().__init__()
         
@@ -1072,7 +1719,6 @@ class MainWindow(QMainWindow):
         self.splash = LoadingSplash()
         self.splash.show()
         self.splash.update_status("Starting MockupCore...", "")
-        QApplication.processEvents()
         
         self.setWindowTitle("MockupCore Batch Exporter Tool")
         self.setFixedSize(2145, 1196)
@@ -1080,16 +1726,19 @@ class MainWindow(QMainWindow):
         # Set window icon
         icon_path = resource_path("mockupcoreicon.ico")
         if os.path.exists(icon_path):
-            from PyQt5.QtGui import QIcon
             self.setWindowIcon(QIcon(icon_path))
         
         self.splash.update_status("Initializing library system...", "")
-        QApplication.processEvents()
         
         # Initialize library system
         self.library = MockupLibrary()
         self.selected_library_psds: Set[str] = set()
         self.thumbnail_widgets = {}
+        self._pending_thumbnails: Set[str] = set()
+        self._thumbnails_total = 0
+        self._init_worker = None
+        self._closing = False  # Close requested while the library scan was still running
+        self.thumbnail_ready.connect(self._on_thumbnail_ready)
         
         root = QWidget()
         self.setCentralWidget(root)
@@ -1215,24 +1864,6 @@ class MainWindow(QMainWindow):
         self.selected_artwork_preview.setAlignment(Qt.AlignCenter)
         preview_layout.addWidget(self.selected_artwork_preview, alignment=Qt.AlignCenter)
         
-        # RIGHT: Instructions
-        instructions_widget = QWidget()
-        instructions_widget.setStyleSheet("background: transparent;")
-        instructions_layout = QVBoxLayout(instructions_widget)
-        instructions_layout.setContentsMargins(15, 0, 0, 0)
-        
-        instructions = QLabel(
-            "<b>HOW TO:</b><br>"
-            "1. Choose the artwork you would like to place into the mockups.<br>"
-            "2. Either use the library to the right and choose your mockups, or use the 'MOCKUP FILE' option to select your own.<br>"
-            "3. Choose a folder you would like your mockups to be exported to.<br>"
-            "4. Click 'GENERATE YOUR MOCKUPS' for your mockups to be processed. Click 'RESET' to start over."
-        )
-        instructions.setStyleSheet("font-size: 15px; line-height: 1.6;")  # Increased from 13px to 15px
-        instructions.setWordWrap(True)
-        instructions_layout.addWidget(instructions)
-        instructions_layout.addStretch()
-        
         # Create a container for preview with status below it
         preview_container = QWidget()
         preview_container.setStyleSheet("background: transparent;")
@@ -1248,7 +1879,7 @@ class MainWindow(QMainWindow):
         
         bottom_section.addWidget(preview_container, stretch=1)
         
-        # Instructions and progress bar side by side
+        # RIGHT: Instructions with the progress bar below
         right_bottom_container = QWidget()
         right_bottom_container.setStyleSheet("background: transparent;")
         right_bottom_layout = QVBoxLayout(right_bottom_container)
@@ -1313,10 +1944,18 @@ class MainWindow(QMainWindow):
         library_frame_layout.addLayout(library_header)
         
         # Scrollable thumbnail grid
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.library_scroll = QScrollArea()
+        self.library_scroll.setWidgetResizable(True)
+        self.library_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        
+        self._create_library_container()
+        library_frame_layout.addWidget(self.library_scroll)
         
+        # Load library thumbnails
+        self._load_library_thumbnails().start()
+    
+    def _create_library_container(self):
+        """Create an empty thumbnail grid and put it in the library scroll area"""
         self.library_container = QFrame()
         self.library_container.setObjectName("LibraryContainer")
         self.library_layout = QGridLayout(self.library_container)
@@ -1328,28 +1967,41 @@ class MainWindow(QMainWindow):
         for col in range(4):
             self.library_layout.setColumnStretch(col, 1)
         
-        scroll.setWidget(self.library_container)
-        library_frame_layout.addWidget(scroll)
-        
-        # Load library thumbnails
-        self._load_library_thumbnails()
+        self.library_scroll.setWidget(self.library_container)
 
-    def _load_library_thumbnails(self):
-        """Load all library mockups as thumbnails with real PSD previews"""
-        
-        def progress_callback(status, detail):
-            """Update splash screen with progress"""
-            if hasattr(self, 'splash') and self.splash:
-                self.splash.update_status(status, detail)
-        
+    def _load_library_thumbnails(self, worker_class=InitWorker):
+        """
+        Set up an InitWorker that scans the library, then shows the mockups as thumbnails.
+        Returns the worker unstarted so callers can connect their own signals first -
+        a signal emitted before its connection exists is lost.
+        """
         # Set progress to start from 0
         self.splash.set_progress_range(0, 100)
         self.splash.set_progress_value(0)
         
         self.splash.update_status("Loading mockup library...", "Scanning for PSD files")
         
-        # Pass splash reference for real-time progress updates during cloud downloads
-        mockups = self.library.get_all_mockups(progress_callback, self.splash)
+        # Scanning and cloud downloads run off the GUI thread; progress arrives via queued signals
+        self._init_worker = worker_class(self.library)
+        self._init_worker.status.connect(self._on_init_status)
+        self._init_worker.progress.connect(self._on_init_progress)
+        self._init_worker.mockups_ready.connect(self._populate_library)
+        return self._init_worker
+    
+    def _on_init_status(self, status, detail):
+        """Update splash screen with library scan status"""
+        if hasattr(self, 'splash') and self.splash:
+            self.splash.update_status(status, detail)
+    
+    def _on_init_progress(self, value):
+        """Update splash progress bar during cloud downloads"""
+        if hasattr(self, 'splash') and self.splash:
+            self.splash.set_progress_value(value)
+    
+    def _populate_library(self, mockups):
+        """Build the thumbnail grid from the scanned mockup paths (runs on the GUI thread)"""
+        if self._closing:
+            return
         
         self.log.append(f"📚 Loading mockup library...")
         self.log.append(f"Found {len(mockups)} PSD file(s)")
@@ -1366,42 +2018,91 @@ class MainWindow(QMainWindow):
             self.library_layout.addWidget(placeholder, 0, 0, 1, 4)
             
             # Close splash
-            if hasattr(self, 'splash') and self.splash:
-                self.splash.close()
-                self.splash = None
+            self._close_splash()
+            self._enable_refresh()
             return
         
         # Update splash for thumbnail generation
-        self.splash.update_status("Generating thumbnails...", f"Processing {len(mockups)} mockup(s)")
-        self.splash.set_progress_range(0, len(mockups))
-        self.splash.set_progress_value(0)
+        if hasattr(self, 'splash') and self.splash:
+            self.splash.update_status("Generating thumbnails...", f"Processing {len(mockups)} mockup(s)")
+            self.splash.set_progress_value(0)
         
-        # Create thumbnail grid (4 columns)
+        # Create thumbnail grid (4 columns) with placeholders - real previews
+        # are extracted on the library's worker pool and arrive via thumbnail_ready
         columns = 4
+        log_lines = []
         for i, psd_path in enumerate(mockups):
             row = i // columns
             col = i % columns
             
-            # Log each mockup being loaded
+            # Log each mockup being loaded (written to the log in one go below)
             filename = os.path.basename(psd_path)
-            self.log.append(f"  • {filename}")
-            
-            # Update splash progress
-            self.splash.update_status(f"Loading thumbnails... ({i+1}/{len(mockups)})", filename)
-            self.splash.set_progress_value(i + 1)
+            log_lines.append(f"  • {filename}")
             
-            thumbnail = MockupThumbnail(psd_path)
+            thumbnail = MockupThumbnail(psd_path, self.library, defer_load=True)
             thumbnail.clicked.connect(self.toggle_library_selection)
             
             self.library_layout.addWidget(thumbnail, row, col, Qt.AlignCenter)  # Center in cell
             self.thumbnail_widgets[psd_path] = thumbnail
         
-        self.log.append(f"✓ Loaded {len(mockups)} mockup(s) successfully")
+        self._append_log_lines(log_lines)
+        
+        # Thumbnails found in QPixmapCache are already shown - only extract the rest
+        to_load = [path for path, thumbnail in self.thumbnail_widgets.items() if not thumbnail.is_loaded]
+        self._pending_thumbnails = set(to_load)
+        self._thumbnails_total = len(self._pending_thumbnails)
+        # Progress counts only the thumbnails still to extract, so the bar fills as the last one lands
+        if hasattr(self, 'splash') and self.splash:
+            self.splash.set_progress_range(0, max(1, self._thumbnails_total))
+        if not to_load:
+            self._finish_thumbnail_loading()
+            return
+        # Decoding and scaling happen on the pool too - the GUI thread only uploads pixmaps
+        self.library.load_thumbnails_async(to_load, self.thumbnail_ready.emit,
+                                           MockupThumbnail.preview_from_jpeg)
+    
+    def _append_log_lines(self, lines):
+        """Append many lines to the log as a single edit (one layout pass instead of one per line)"""
+        if not lines:
+            return
+        cursor = QTextCursor(self.log.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        if not self.log.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText("\n".join(lines))  # Newlines become paragraph breaks
+        cursor.endEditBlock()
+    
+    def _on_thumbnail_ready(self, psd_path, preview):
+        """Install a thumbnail extracted on the worker pool (runs on the GUI thread)"""
+        if psd_path not in self._pending_thumbnails:
+            return
+        self._pending_thumbnails.discard(psd_path)
+        
+        thumbnail = self.thumbnail_widgets.get(psd_path)
+        if thumbnail:
+            thumbnail.set_preview_image(preview)
+        
+        # Update splash progress
+        loaded = self._thumbnails_total - len(self._pending_thumbnails)
+        if hasattr(self, 'splash') and self.splash:
+            self.splash.update_status(f"Loading thumbnails... ({loaded}/{self._thumbnails_total})",
+                                      os.path.basename(psd_path))
+            self.splash.set_progress_value(loaded)
+        
+        if not self._pending_thumbnails:
+            self._finish_thumbnail_loading()
+    
+    def _finish_thumbnail_loading(self):
+        """All library thumbnails are in place"""
+        self.log.append(f"✓ Loaded {len(self.thumbnail_widgets)} mockup(s) successfully")
+        self._enable_refresh()
         
-        # Close splash when done
+        # Close splash when done - this splash only, a refresh may have opened a new one by then
         if hasattr(self, 'splash') and self.splash:
             self.splash.update_status("Ready!", "MockupCore loaded successfully")
-            QTimer.singleShot(500, self._close_splash)  # Small delay before closing
+            QTimer.singleShot(500, self.splash.close)  # Small delay before closing
+            self.splash = None
     
     def _close_splash(self):
         """Close the loading splash screen"""
@@ -1409,6 +2110,23 @@ class MainWindow(QMainWindow):
             self.splash.close()
             self.splash = None
 
+    def closeEvent(self, event):
+        """Close once the library scan thread is done - destroying a running QThread aborts"""
+        worker = self._init_worker
+        if worker and worker.isRunning():
+            # Disappear now, finish closing when the scan (and any download) ends
+            event.ignore()
+            if not self._closing:
+                self._closing = True
+                self.hide()
+                self._close_splash()
+                worker.finished.connect(self.close)
+            return
+        
+        # Drop queued thumbnail extractions - nothing is left to show them
+        self.library.thumbnail_pool.shutdown(wait=False, cancel_futures=True)
+        super().closeEvent(event)
+    
     def toggle_library_selection(self, psd_path):
         """Toggle selection of a library mockup"""
         if psd_path in self.selected_library_psds:
@@ -1422,16 +2140,16 @@ class MainWindow(QMainWindow):
     
     def select_all_library(self):
         """Select all library mockups"""
-        for psd_path, thumbnail in self.thumbnail_widgets.items():
+        for thumbnail in self.thumbnail_widgets.values():
             thumbnail.set_selected(True)
-            self.selected_library_psds.add(psd_path)
+        self.selected_library_psds.update(self.thumbnail_widgets)
         
         count = len(self.selected_library_psds)
         self.log.append(f"✓ Selected all {count} library mockups")
     
     def deselect_all_library(self):
         """Deselect all library mockups"""
-        for psd_path, thumbnail in self.thumbnail_widgets.items():
+        for thumbnail in self.thumbnail_widgets.values():
             thumbnail.set_selected(False)
         
         self.selected_library_psds.clear()
@@ -1439,53 +2157,71 @@ class MainWindow(QMainWindow):
     
     def refresh_library(self):
         """Refresh the library - reload cloud mockups and update display"""
+        # Still scanning or loading thumbnails - their results would land in the new grid
+        if (self._init_worker and self._init_worker.isRunning()) or self._pending_thumbnails:
+            return
+        
         self.log.append("↻ Refreshing mockup library...")
         self.refresh_btn.setEnabled(False)
         self.refresh_btn.setText("LOADING...")
         
         # Show loading splash for refresh with close button
+        self._close_splash()
         self.splash = LoadingSplash()
         self.splash.show()
         self.splash.update_status("Refreshing library...", "")
         self.splash.set_progress_range(0, 100)
         self.splash.set_progress_value(0)
-        QApplication.processEvents()
-        
-        # Clear cache ONLY when manually refreshing (not on startup)
-        try:
-            self.splash.update_status("Clearing cache...", "")
-            self.library.clear_cache()
-            self.log.append("Cache cleared - re-downloading cloud files...")
-            QApplication.processEvents()
-        except Exception as e:
-            self.log.append(f"⚠️ Cache clear error: {e}")
         
         # Clear current display
         self.selected_library_psds.clear()
         self.thumbnail_widgets.clear()
-        
-        # Clear the grid layout
-        while self.library_layout.count():
-            item = self.library_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        QApplication.processEvents()
-        
-        # Reload thumbnails (this will re-download cloud files and show progress)
-        self._load_library_thumbnails()
-        
+        self._pending_thumbnails.clear()
+        
+        # Swap in an empty grid - the old container and all its thumbnails go in one deletion
+        old_container = self.library_scroll.takeWidget()
+        if old_container:
+            old_container.deleteLater()
+        self._create_library_container()
+        
+        # Clear cache ONLY when manually refreshing (not on startup), then reload
+        # thumbnails - both on a RefreshWorker (re-downloads cloud files and shows progress)
+        worker = self._load_library_thumbnails(RefreshWorker)
+        worker.cache_cleared.connect(self._on_cache_cleared)
+        worker.finished.connect(self._on_refresh_done)
+        worker.start()
+    
+    def _on_cache_cleared(self, cleared):
+        """Log the outcome of the refresh worker's cache clear"""
+        if cleared:
+            self.log.append("Cache cleared - re-downloading cloud files...")
+        else:
+            self.log.append("⚠️ Cache clear error - see console output")
+    
+    def _on_refresh_done(self):
+        """The refresh scan has finished - thumbnails may still be loading"""
+        self.log.append("✓ Library refreshed")
+    
+    def _enable_refresh(self):
+        """Allow refreshing again once the library and its thumbnails are loaded"""
         self.refresh_btn.setEnabled(True)
         self.refresh_btn.setText("↻ REFRESH")
-        self.log.append("✓ Library refreshed")
 
     def pick_art(self):
         p, _ = QFileDialog.getOpenFileName(self, "Select Design", "", "Images (*.png *.jpg *.jpeg)")
         if p:
             self.art_path.setText(p)
             self.art_path.setStyleSheet("")
-            # Update the preview in the bottom section - scaled to fit new size
-            pix = QPixmap(p).scaled(180, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            # Update the preview in the bottom section - scaled to fit new size.
+            # The reader scales while decoding, so large artwork is never held at full size
+            reader = QImageReader(p)
+            size = reader.size()
+            if size.isValid():
+                reader.setScaledSize(size.scaled(180, 180, Qt.KeepAspectRatio))
+                pix = QPixmap.fromImage(reader.read())
+            else:
+                # Format can't report its size up front - decode, then scale
+                pix = QPixmap.fromImage(reader.read()).scaled(180, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation)
             self.selected_artwork_preview.setPixmap(pix)
             
     def pick_psds(self):
@@ -1540,7 +2276,7 @@ class MainWindow(QMainWindow):
         self.run_btn.setEnabled(False)
         self.status.setText(f"Processing {len(all_psds)} mockup(s)...")
         
-        job = Job(all_psds, self.art_path.text(), self.out_dir.text())
+        job = Job(all_psds, self.art_path.text(), self.out_dir.text(), self.library.cache_dir)
         self.worker = Worker(job)
         self.worker.log.connect(self.log.append)
         self.worker.progress.connect(self.progress.setValue)
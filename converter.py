@@ -1,11 +1,16 @@
 import base64
 
+# Read in chunks that are a multiple of 3 bytes, so each chunk encodes without
+# padding and the pieces join into exactly the same single line of text
+CHUNK_SIZE = 3 * 64 * 1024
+
 # This looks for your font file and turns it into text
-with open("SpaceGrotesk-Regular.ttf", "rb") as f:
-    text_version = base64.b64encode(f.read()).decode('utf-8')
-    
 # This creates a new file for you called 'my_font.txt'
-with open("my_font.txt", "w") as f:
-    f.write(text_version)
+with open("SpaceGrotesk-Regular.ttf", "rb") as fin, open("my_font.txt", "wb") as fout:
+    while True:
+        chunk = fin.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        fout.write(base64.b64encode(chunk))
 
 print("Done! Open 'my_font.txt' and copy everything inside.")
\ No newline at end of file